@@ -4,7 +4,4 @@ from app.db.base import AsyncSessionLocal
 
 async def get_db() -> AsyncGenerator:
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
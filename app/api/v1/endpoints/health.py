@@ -0,0 +1,41 @@
+
+import asyncio
+import logging
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from app.core.config import settings
+from app.db.base import engine
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+_status = {"database": False}
+
+async def check_database() -> bool:
+    try:
+        async with asyncio.timeout(settings.HEALTH_CHECK_TIMEOUT):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except (SQLAlchemyError, OSError, TimeoutError):
+        return False
+    return True
+
+async def update_database_status():
+    try:
+        _status["database"] = await check_database()
+    except Exception:
+        logger.exception("Database health check failed")
+        _status["database"] = False
+
+async def monitor_database():
+    while True:
+        await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL)
+        await update_database_status()
+
+@router.get("/health/db")
+async def health_db():
+    if not _status["database"]:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"status": "ok"}
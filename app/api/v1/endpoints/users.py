@@ -1,7 +1,8 @@
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from app.api.deps import get_db
 from app.schemas.user import User, UserCreate, UserUpdate
 from app.services.user import UserService
@@ -9,8 +10,20 @@ from app.services.user import UserService
 router = APIRouter()
 
 @router.get("/users/", response_model=List[User])
-async def get_users(db: AsyncSession = Depends(get_db)):
-    return await UserService.get_users(db)
+async def get_users(
+    request: Request,
+    response: Response,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    # Fetch one extra row to learn whether another page exists.
+    users = await UserService.get_users(db, after_id=after_id, limit=limit + 1)
+    if len(users) > limit:
+        users = users[:limit]
+        next_url = request.url.include_query_params(after_id=users[-1].id, limit=limit)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return users
 
 @router.get("/users/{user_id}", response_model=User)
 async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
@@ -21,11 +34,32 @@ async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
 
 @router.post("/users/", response_model=User)
 async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
-    return await UserService.create_user(db, user)
+    existing = await UserService.get_user_by_username_or_email(
+        db, user.username, user.email
+    )
+    if existing:
+        if existing.username == user.username:
+            raise HTTPException(status_code=400, detail="Username already registered")
+        raise HTTPException(status_code=400, detail="Email already registered")
+    try:
+        return await UserService.create_user(db, user)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400, detail="Username or email already registered"
+        ) from None
 
 @router.put("/users/{user_id}", response_model=User)
-async def update_user(user_id: int, user: UserUpdate, db: AsyncSession = Depends(get_db)):
-    updated_user = await UserService.update_user(db, user_id, user)
+async def update_user(
+    user_id: int, user: UserUpdate, db: AsyncSession = Depends(get_db)
+):
+    try:
+        updated_user = await UserService.update_user(db, user_id, user)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400, detail="Username or email already registered"
+        ) from None
     if not updated_user:
         raise HTTPException(status_code=404, detail="User not found")
     return updated_user
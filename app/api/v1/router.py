@@ -1,6 +1,7 @@
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import users
+from app.api.v1.endpoints import health, users
 
 router = APIRouter()
 router.include_router(users.router, tags=["users"])
+router.include_router(health.router, tags=["health"])
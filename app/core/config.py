@@ -1,9 +1,36 @@
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
+from sqlalchemy.engine import make_url
 import os
 
 class Settings(BaseSettings):
     DATABASE_URL: str = os.environ.get('DATABASE_URL', 'sqlite+aiosqlite:///./sql_app.db')
     API_V1_STR: str = "/api/v1"
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 50
+    DB_MAX_OVERFLOW: int = 50
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PREWARM: int = 10
+    DB_QUERY_WARN_THRESHOLD: int = 5
+    HEALTH_CHECK_INTERVAL: float = 5.0
+    # Keep below HEALTH_CHECK_INTERVAL so a hung probe is reported in time.
+    HEALTH_CHECK_TIMEOUT: float = 2.0
+
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def use_asyncpg_driver(cls, value: str) -> str:
+        url = make_url(value)
+        if url.drivername in ("postgres", "postgresql"):
+            url = url.set(drivername="postgresql+asyncpg")
+        if url.drivername != "postgresql+asyncpg":
+            return value
+        # asyncpg takes libpq's sslmode values under the name ssl.
+        if "sslmode" in url.query:
+            query = dict(url.query)
+            query["ssl"] = query.pop("sslmode")
+            url = url.set(query=query)
+        return url.render_as_string(hide_password=False)
 
 settings = Settings()
@@ -0,0 +1,29 @@
+
+import logging
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.config import settings
+from app.db.base import query_counter
+
+logger = logging.getLogger(__name__)
+
+class QueryCountMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        counter = [0]
+        token = query_counter.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            query_counter.reset(token)
+        if counter[0] > settings.DB_QUERY_WARN_THRESHOLD:
+            logger.warning(
+                "%s %s issued %d database queries",
+                scope["method"],
+                scope["path"],
+                counter[0],
+            )
@@ -1,15 +1,50 @@
 
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+def _pool_sizing(database_url: str) -> dict:
+    # Sizing only applies to queue pools; e.g. in-memory SQLite uses StaticPool.
+    url = make_url(database_url)
+    if not issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    **_pool_sizing(settings.DATABASE_URL),
+)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+# Holds a one-element list per HTTP request so increments made from copied
+# contexts (thread pool, child tasks) still reach the request's counter.
+query_counter: ContextVar[Optional[List[int]]] = ContextVar(
+    "db_query_counter", default=None
+)
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def count_query(*_args):
+    counter = query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+async def warm_pool(size: int):
+    # Keep every connection checked out until all are open, so each is a
+    # distinct pool slot; the stack returns them all even if one fails.
+    async with AsyncExitStack() as stack:
+        for _ in range(size):
+            await stack.enter_async_context(engine.connect())
@@ -1,42 +1,73 @@
 
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, or_, select, update
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
+_get_user_stmt = select(User).where(User.id == bindparam("user_id"))
+_get_user_by_username_or_email_stmt = (
+    select(User.username, User.email)
+    .where(
+        or_(
+            User.username == bindparam("username"),
+            User.email == bindparam("email"),
+        )
+    )
+    .limit(1)
+)
+
 class UserService:
     @staticmethod
-    async def get_users(db: AsyncSession):
-        result = await db.execute(select(User))
+    async def get_users(
+        db: AsyncSession, after_id: Optional[int] = None, limit: int = 100
+    ):
+        query = select(User).order_by(User.id).limit(limit)
+        if after_id is not None:
+            query = query.where(User.id > after_id)
+        result = await db.execute(query)
         return result.scalars().all()
 
     @staticmethod
     async def get_user(db: AsyncSession, user_id: int):
-        result = await db.execute(select(User).filter(User.id == user_id))
+        result = await db.execute(_get_user_stmt, {"user_id": user_id})
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_user_by_username_or_email(
+        db: AsyncSession, username: str, email: str
+    ):
+        result = await db.execute(
+            _get_user_by_username_or_email_stmt, {"username": username, "email": email}
+        )
+        return result.first()
+
     @staticmethod
     async def create_user(db: AsyncSession, user: UserCreate):
         db_user = User(**user.model_dump())
         db.add(db_user)
         await db.commit()
-        await db.refresh(db_user)
         return db_user
 
     @staticmethod
     async def update_user(db: AsyncSession, user_id: int, user: UserUpdate):
-        db_user = await UserService.get_user(db, user_id)
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**user.model_dump())
+            .returning(User)
+        )
+        db_user = result.scalar_one_or_none()
         if db_user:
-            for key, value in user.model_dump().items():
-                setattr(db_user, key, value)
             await db.commit()
-            await db.refresh(db_user)
         return db_user
 
     @staticmethod
     async def delete_user(db: AsyncSession, user_id: int):
-        db_user = await UserService.get_user(db, user_id)
+        result = await db.execute(
+            delete(User).where(User.id == user_id).returning(User)
+        )
+        db_user = result.scalar_one_or_none()
         if db_user:
-            await db.delete(db_user)
             await db.commit()
         return db_user
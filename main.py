@@ -1,16 +1,35 @@
 
 import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
-from app.db.base import Base, engine
+from fastapi.responses import ORJSONResponse
+from app.core.config import settings
+from app.core.middleware import QueryCountMiddleware
+from app.db.base import Base, engine, warm_pool
+from app.api.v1.endpoints.health import monitor_database, update_database_status
 from app.api.v1.router import router
 import uvicorn
 
-app = FastAPI(title="User Management API")
-
-@app.on_event("startup")
-async def init_db():
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await warm_pool(min(settings.DB_POOL_PREWARM, settings.DB_POOL_SIZE))
+    await update_database_status()
+    monitor = asyncio.create_task(monitor_database())
+    yield
+    monitor.cancel()
+    with suppress(asyncio.CancelledError):
+        await monitor
+    await engine.dispose()
+
+app = FastAPI(
+    title="User Management API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+app.add_middleware(QueryCountMiddleware)
 
 app.include_router(router, prefix="/api/v1")
 